@@ -1,9 +1,11 @@
 """Sistema de cache local basado en hash SHA256."""
 
 import hashlib
-import json
+import sqlite3
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+
+import orjson
 
 
 class Cache:
@@ -11,11 +13,42 @@ class Cache:
 
     CACHE_DIR_NAME = ".api-docs-normalizer"
     CACHE_SUBDIR = "cache"
-    FILE_EXTENSION = ".json"
-    ENCODING = "utf-8"
+    DB_FILE_NAME = "cache.sqlite3"
+
+    # Sentencias SQL del almacén clave-valor (clave: digest SHA256 de 32 bytes)
+    CREATE_TABLE_SQL = (
+        "CREATE TABLE IF NOT EXISTS results ("
+        "hash BLOB PRIMARY KEY, value BLOB NOT NULL) WITHOUT ROWID"
+    )
+    SELECT_SQL = "SELECT value FROM results WHERE hash = ?"
+    EXISTS_SQL = "SELECT 1 FROM results WHERE hash = ?"
+    UPSERT_SQL = "INSERT OR REPLACE INTO results (hash, value) VALUES (?, ?)"
+
+    # Índice de huellas de archivo: (ruta, tamaño, mtime_ns) -> hash del contenido
+    CREATE_STAT_TABLE_SQL = (
+        "CREATE TABLE IF NOT EXISTS stat_index ("
+        "path TEXT PRIMARY KEY, size INTEGER NOT NULL, "
+        "mtime_ns INTEGER NOT NULL, hash BLOB NOT NULL)"
+    )
+    SELECT_STAT_SQL = (
+        "SELECT hash FROM stat_index WHERE path = ? AND size = ? AND mtime_ns = ?"
+    )
+    UPSERT_STAT_SQL = (
+        "INSERT OR REPLACE INTO stat_index (path, size, mtime_ns, hash) "
+        "VALUES (?, ?, ?, ?)"
+    )
 
     def __init__(self):
         self.cache_dir = self._initialize_cache_directory()
+        self.connection = self._connect(self.cache_dir / self.DB_FILE_NAME)
+        self._pending: Dict[bytes, bytes] = {}
+        self._pending_stats: Dict[str, Tuple[str, int, int, bytes]] = {}
+
+    def __enter__(self) -> "Cache":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.flush()
 
     def _initialize_cache_directory(self) -> Path:
         """
@@ -28,19 +61,60 @@ class Cache:
         cache_dir.mkdir(parents=True, exist_ok=True)
         return cache_dir
 
-    def get_hash(self, content: str) -> str:
+    def _connect(self, db_path: Path) -> sqlite3.Connection:
+        """
+        Abre la base de datos del cache o, si falla, una base en memoria.
+
+        Un archivo corrupto o bloqueado más allá del timeout no debe impedir el
+        procesamiento: en ese caso el cache solo dura lo que dura la ejecución.
+
+        Args:
+            db_path: Path al archivo de base de datos
+
+        Returns:
+            Conexión SQLite abierta
+        """
+        try:
+            return self._open_database(str(db_path))
+        except sqlite3.Error:
+            return self._open_database(":memory:")
+
+    def _open_database(self, database: str) -> sqlite3.Connection:
+        """
+        Abre (o crea) la base de datos SQLite que almacena el cache.
+
+        Args:
+            database: Ruta del archivo de base de datos o ":memory:"
+
+        Returns:
+            Conexión SQLite abierta
+        """
+        connection = sqlite3.connect(database)
+        try:
+            with connection:
+                connection.execute(self.CREATE_TABLE_SQL)
+                connection.execute(self.CREATE_STAT_TABLE_SQL)
+        except sqlite3.Error:
+            connection.close()
+            raise
+        return connection
+
+    def get_hash(self, content: bytes) -> bytes:
         """
         Calcula el hash SHA256 del contenido.
 
+        El hash solo se usa como clave de cache, por lo que se marca con
+        ``usedforsecurity=False`` para evitar la capa FIPS de OpenSSL.
+
         Args:
-            content: Contenido a hashear
+            content: Contenido a hashear, en bytes
 
         Returns:
-            Hash SHA256 en hexadecimal
+            Digest SHA256 en bruto (32 bytes)
         """
-        return hashlib.sha256(content.encode(self.ENCODING)).hexdigest()
+        return hashlib.sha256(content, usedforsecurity=False).digest()
 
-    def get(self, content_hash: str) -> Optional[Dict[str, Any]]:
+    def get(self, content_hash: bytes) -> Optional[Dict[str, Any]]:
         """
         Obtiene el resultado cacheado si existe.
 
@@ -50,84 +124,134 @@ class Cache:
         Returns:
             Resultado cacheado o None si no existe o está corrupto
         """
-        cache_file = self._get_cache_file_path(content_hash)
-
-        if not cache_file.exists():
-            return None
-
         try:
-            return self._read_cache_file(cache_file)
-        except (json.JSONDecodeError, IOError):
+            value = self._pending.get(content_hash)
+            if value is None:
+                row = self.connection.execute(self.SELECT_SQL, (content_hash,)).fetchone()
+                if row is None:
+                    return None
+                value = row[0]
+            return orjson.loads(value)
+        except (orjson.JSONDecodeError, sqlite3.Error):
             return None
 
-    def set(self, content_hash: str, result: Dict[str, Any]) -> None:
+    def set(
+        self, content_hash: bytes, result: Dict[str, Any], delay: bool = False
+    ) -> None:
         """
         Guarda el resultado en cache.
 
         Args:
             content_hash: Hash del contenido
             result: Resultado a cachear
+            delay: Si es True, la escritura se encola hasta el próximo flush()
         """
-        cache_file = self._get_cache_file_path(content_hash)
+        value = orjson.dumps(result)
 
-        try:
-            self._write_cache_file(cache_file, result)
-        except IOError:
-            # Fallar silenciosamente si no se puede escribir
-            pass
+        if delay:
+            self._pending[content_hash] = value
+            return
 
-    def exists(self, content_hash: str) -> bool:
+        self._write_entries([(content_hash, value)])
+
+    def lookup_stat(self, path: str, size: int, mtime_ns: int) -> Optional[bytes]:
         """
-        Verifica si existe un resultado cacheado.
+        Busca el hash de contenido registrado para una huella de archivo.
 
         Args:
-            content_hash: Hash del contenido
+            path: Ruta absoluta del archivo
+            size: Tamaño del archivo en bytes
+            mtime_ns: Fecha de modificación en nanosegundos
 
         Returns:
-            True si existe, False en caso contrario
+            Hash del contenido o None si el archivo no está registrado o cambió
         """
-        cache_file = self._get_cache_file_path(content_hash)
-        return cache_file.exists()
+        pending = self._pending_stats.get(path)
+        if pending is not None:
+            return pending[3] if pending[1:3] == (size, mtime_ns) else None
+
+        try:
+            row = self.connection.execute(
+                self.SELECT_STAT_SQL, (path, size, mtime_ns)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row is not None else None
 
-    def _get_cache_file_path(self, content_hash: str) -> Path:
+    def set_stat(
+        self,
+        path: str,
+        size: int,
+        mtime_ns: int,
+        content_hash: bytes,
+        delay: bool = False,
+    ) -> None:
         """
-        Obtiene la ruta del archivo de cache para un hash dado.
+        Registra el hash de contenido correspondiente a una huella de archivo.
 
         Args:
+            path: Ruta absoluta del archivo
+            size: Tamaño del archivo en bytes
+            mtime_ns: Fecha de modificación en nanosegundos
             content_hash: Hash del contenido
-
-        Returns:
-            Path al archivo de cache
+            delay: Si es True, la escritura se encola hasta el próximo flush()
         """
-        return self.cache_dir / f"{content_hash}{self.FILE_EXTENSION}"
+        entry = (path, size, mtime_ns, content_hash)
 
-    def _read_cache_file(self, cache_file: Path) -> Dict[str, Any]:
-        """
-        Lee el contenido de un archivo de cache.
+        if delay:
+            self._pending_stats[path] = entry
+            return
 
-        Args:
-            cache_file: Path al archivo de cache
+        self._write_entries([], [entry])
 
-        Returns:
-            Contenido del archivo como diccionario
+    def flush(self) -> None:
+        """Escribe en una única transacción todas las entradas encoladas."""
+        if not self._pending and not self._pending_stats:
+            return
 
-        Raises:
-            json.JSONDecodeError: Si el archivo no es JSON válido
-            IOError: Si hay un error de lectura
+        entries = list(self._pending.items())
+        stat_entries = list(self._pending_stats.values())
+        self._pending.clear()
+        self._pending_stats.clear()
+        self._write_entries(entries, stat_entries)
+
+    def _write_entries(
+        self,
+        entries: List[Tuple[bytes, bytes]],
+        stat_entries: Optional[List[Tuple[str, int, int, bytes]]] = None,
+    ) -> None:
         """
-        with open(cache_file, "r", encoding=self.ENCODING) as f:
-            return json.load(f)
+        Escribe un conjunto de entradas en una sola transacción.
 
-    def _write_cache_file(self, cache_file: Path, result: Dict[str, Any]) -> None:
+        Args:
+            entries: Pares (hash, valor serializado) a guardar
+            stat_entries: Huellas de archivo (ruta, tamaño, mtime_ns, hash)
         """
-        Escribe el resultado en el archivo de cache.
+        try:
+            with self.connection:
+                if entries:
+                    self.connection.executemany(self.UPSERT_SQL, entries)
+                if stat_entries:
+                    self.connection.executemany(self.UPSERT_STAT_SQL, stat_entries)
+        except sqlite3.Error:
+            # Fallar silenciosamente si no se puede escribir
+            pass
+
+    def exists(self, content_hash: bytes) -> bool:
+        """
+        Verifica si existe un resultado cacheado.
 
         Args:
-            cache_file: Path al archivo de cache
-            result: Resultado a escribir
+            content_hash: Hash del contenido
 
-        Raises:
-            IOError: Si hay un error de escritura
+        Returns:
+            True si existe, False en caso contrario
         """
-        with open(cache_file, "w", encoding=self.ENCODING) as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        if content_hash in self._pending:
+            return True
+
+        try:
+            row = self.connection.execute(self.EXISTS_SQL, (content_hash,)).fetchone()
+        except sqlite3.Error:
+            return False
+        return row is not None
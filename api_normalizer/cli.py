@@ -2,8 +2,10 @@
 
 import sys
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, BinaryIO, Callable
 
 from .parser import Parser
 from .normalizer import Normalizer
@@ -11,17 +13,81 @@ from .cache import Cache
 from .exporters.openapi_yaml import export_yaml
 from .exporters.openapi_json import export_json
 
+try:
+    # Dependencia opcional para --compress zstd: pip install ".[zstd]"
+    import zstandard  # type: ignore
+except ImportError:
+    zstandard = None
+
 
 class Processor:
     """Orquesta el procesamiento de archivos de documentación."""
 
-    def __init__(self):
+    OUTPUT_BUFFER_SIZE = 1 << 20
+
+    # Compresión de la salida
+    ZSTD_EXTENSION = ".zst"
+    ZSTD_LEVEL = 3
+
+    def __init__(self, compression: Optional[str] = None):
         self.parser = Parser()
         self.normalizer = Normalizer()
-        self.cache = Cache()
+        self.compression = compression
+        self._cache: Optional[Cache] = None
+
+    @property
+    def cache(self) -> Cache:
+        """
+        Cache local, que se abre la primera vez que se usa.
+
+        Con jobs > 1 el proceso principal solo reparte archivos y nunca abre
+        la base de datos; cada trabajador usa su propio cache.
+
+        Returns:
+            Instancia de Cache
+        """
+        if self._cache is None:
+            self._cache = Cache()
+        return self._cache
+
+    def process_files(
+        self, input_paths: List[str], output_format: str, jobs: int = 1
+    ) -> None:
+        """
+        Procesa varios archivos de entrada.
+
+        Con un solo proceso, las escrituras al cache se acumulan y se guardan
+        en una única transacción al terminar el lote. Con jobs > 1 los
+        archivos se reparten entre procesos que comparten el mismo cache.
+
+        Args:
+            input_paths: Rutas a los archivos de entrada
+            output_format: Formato de salida (yaml o json)
+            jobs: Número de procesos a utilizar
+        """
+        if jobs > 1:
+            with ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_initialize_worker,
+                initargs=(self.compression,),
+            ) as executor:
+                list(
+                    executor.map(
+                        _process_file_in_worker, input_paths, repeat(output_format)
+                    )
+                )
+            return
+
+        with self.cache:
+            for input_path in input_paths:
+                self.process_file(input_path, None, output_format, delay_cache=True)
 
     def process_file(
-        self, input_path: str, output_path: Optional[str], output_format: str
+        self,
+        input_path: str,
+        output_path: Optional[str],
+        output_format: str,
+        delay_cache: bool = False,
     ) -> None:
         """
         Procesa un archivo de entrada y genera la salida normalizada.
@@ -30,12 +96,12 @@ class Processor:
             input_path: Ruta al archivo de entrada
             output_path: Ruta al archivo de salida (opcional)
             output_format: Formato de salida (yaml o json)
+            delay_cache: Si es True, la escritura al cache se difiere
         """
         input_file = Path(input_path)
         self._validate_input_file(input_file)
 
-        content = self._read_input_file(input_file)
-        spec = self._get_or_process_spec(content, input_file.stem)
+        spec = self._get_or_process_spec(input_file, delay_cache)
 
         output_file = self._determine_output_file(input_file, output_path, output_format)
         self._write_output_file(output_file, spec, output_format)
@@ -55,31 +121,50 @@ class Processor:
         if not input_file.exists():
             raise FileNotFoundError(f"El archivo {input_file} no existe")
 
-    def _read_input_file(self, input_file: Path) -> str:
+    def _read_input_bytes(self, input_file: Path) -> bytes:
         """
-        Lee el contenido del archivo de entrada.
+        Lee el contenido del archivo de entrada sin decodificar.
 
         Args:
             input_file: Path al archivo de entrada
 
         Returns:
-            Contenido del archivo
+            Contenido del archivo en bytes
         """
-        with open(input_file, "r", encoding="utf-8") as f:
+        with open(input_file, "rb") as f:
             return f.read()
 
-    def _get_or_process_spec(self, content: str, title: str) -> Dict[str, Any]:
+    def _get_or_process_spec(
+        self, input_file: Path, delay_cache: bool = False
+    ) -> Dict[str, Any]:
         """
         Obtiene el esquema desde cache o lo procesa.
 
+        Si la huella del archivo (ruta, tamaño y mtime) coincide con una ya
+        registrada, se reutiliza su hash sin leer el archivo. En caso
+        contrario el hash se calcula sobre los bytes del archivo; el contenido
+        solo se decodifica a texto si no hay resultado cacheado.
+
         Args:
-            content: Contenido del archivo
-            title: Título para la API
+            input_file: Path al archivo de entrada
+            delay_cache: Si es True, la escritura al cache se difiere
 
         Returns:
             Esquema OpenAPI como diccionario
         """
-        content_hash = self.cache.get_hash(content)
+        file_stat = input_file.stat()
+        stat_key = (str(input_file.resolve()), file_stat.st_size, file_stat.st_mtime_ns)
+
+        content_hash = self.cache.lookup_stat(*stat_key)
+        if content_hash is not None:
+            cached_result = self.cache.get(content_hash)
+            if cached_result:
+                print("[cache] using cached result", file=sys.stderr)
+                return cached_result
+
+        raw_content = self._read_input_bytes(input_file)
+        content_hash = self.cache.get_hash(raw_content)
+        self.cache.set_stat(*stat_key, content_hash, delay=delay_cache)
 
         if self.cache.exists(content_hash):
             print("[cache] using cached result", file=sys.stderr)
@@ -88,8 +173,12 @@ class Processor:
                 return cached_result
             # Si el cache está corrupto, procesar de nuevo
 
-        spec = self._process_content(content, title)
-        self.cache.set(content_hash, spec)
+        # Se replica la traducción de saltos de línea del modo texto (\r\n y \r
+        # pasan a \n); el hash se sigue calculando sobre los bytes originales
+        content = raw_content.decode("utf-8")
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+        spec = self._process_content(content, input_file.stem)
+        self.cache.set(content_hash, spec, delay=delay_cache)
         return spec
 
     def _process_content(self, content: str, title: str) -> Dict[str, Any]:
@@ -125,9 +214,18 @@ class Processor:
             Path al archivo de salida
         """
         if output_path:
-            return Path(output_path)
+            output_file = Path(output_path)
+            # Con --compress la salida siempre lleva .zst, también si es explícita
+            compressed = self.compression == "zstd"
+            if compressed and output_file.suffix != self.ZSTD_EXTENSION:
+                output_file = output_file.with_name(
+                    output_file.name + self.ZSTD_EXTENSION
+                )
+            return output_file
 
         extension = ".yaml" if output_format == "yaml" else ".json"
+        if self.compression == "zstd":
+            extension += self.ZSTD_EXTENSION
         return input_file.with_suffix(extension)
 
     def _write_output_file(
@@ -141,13 +239,73 @@ class Processor:
             spec: Esquema OpenAPI
             output_format: Formato de salida
         """
-        if output_format == "yaml":
-            output_content = export_yaml(spec)
-        else:
-            output_content = export_json(spec)
+        exporter = export_yaml if output_format == "yaml" else export_json
+
+        if self.compression == "zstd" or output_file.suffix == self.ZSTD_EXTENSION:
+            self._write_compressed_output_file(output_file, spec, exporter)
+            return
+
+        # El YAML se emite directamente al archivo sin construir antes la
+        # salida completa en memoria; el JSON lo genera orjson completo en
+        # bytes y se escribe de una sola vez
+        with open(output_file, "wb", buffering=self.OUTPUT_BUFFER_SIZE) as f:
+            exporter(spec, f)
+
+    def _write_compressed_output_file(
+        self,
+        output_file: Path,
+        spec: Dict[str, Any],
+        exporter: Callable[[Dict[str, Any], BinaryIO], None],
+    ) -> None:
+        """
+        Escribe el esquema OpenAPI comprimido con zstd.
+
+        Args:
+            output_file: Path al archivo de salida
+            spec: Esquema OpenAPI
+            exporter: Función de exportación del formato elegido
+
+        Raises:
+            RuntimeError: Si el paquete zstandard no está instalado
+        """
+        if zstandard is None:
+            raise RuntimeError(
+                "La compresión zstd requiere el paquete 'zstandard' "
+                '(pip install "api-docs-normalizer[zstd]")'
+            )
+
+        compressor = zstandard.ZstdCompressor(level=self.ZSTD_LEVEL)
+        with open(output_file, "wb") as raw:
+            with compressor.stream_writer(raw, closefd=False) as f:
+                exporter(spec, f)
+
+
+# Processor propio de cada proceso trabajador (ver Processor.process_files)
+_worker_processor: Optional[Processor] = None
+
+
+def _initialize_worker(compression: Optional[str]) -> None:
+    """
+    Crea el Processor del proceso trabajador.
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(output_content)
+    Args:
+        compression: Compresión de la salida (ver Processor)
+    """
+    global _worker_processor
+    _worker_processor = Processor(compression)
+
+
+def _process_file_in_worker(input_path: str, output_format: str) -> None:
+    """
+    Procesa un archivo dentro de un proceso trabajador.
+
+    Args:
+        input_path: Ruta al archivo de entrada
+        output_format: Formato de salida (yaml o json)
+    """
+    # Lo crea _initialize_worker al arrancar el proceso trabajador
+    assert _worker_processor is not None
+    _worker_processor.process_file(input_path, None, output_format)
 
 
 def main():
@@ -160,7 +318,8 @@ def main():
     parser.add_argument(
         "input",
         type=str,
-        help="Archivo de entrada con documentación de la API (Markdown o texto plano)",
+        nargs="+",
+        help="Archivo(s) de entrada con documentación de la API (Markdown o texto plano)",
     )
 
     parser.add_argument(
@@ -168,7 +327,10 @@ def main():
         "--out",
         type=str,
         default=None,
-        help="Archivo de salida (por defecto: input con extensión .yaml o .json)",
+        help=(
+            "Archivo de salida (por defecto: input con extensión .yaml o .json). "
+            "Solo válido con un único archivo de entrada"
+        ),
     )
 
     parser.add_argument(
@@ -179,11 +341,38 @@ def main():
         help="Formato de salida (default: yaml)",
     )
 
+    parser.add_argument(
+        "--compress",
+        choices=["zstd"],
+        default=None,
+        help=(
+            "Comprime la salida y añade la extensión .zst, también a --out "
+            "si no la tiene. Se activa igualmente si --out termina en .zst"
+        ),
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Número de procesos para procesar varios archivos (default: 1)",
+    )
+
     args = parser.parse_args()
 
+    if args.out and len(args.input) > 1:
+        parser.error("--out solo puede usarse con un único archivo de entrada")
+
+    if args.jobs < 1:
+        parser.error("--jobs debe ser mayor o igual que 1")
+
     try:
-        processor = Processor()
-        processor.process_file(args.input, args.out, args.format)
+        processor = Processor(compression=args.compress)
+        if len(args.input) > 1:
+            processor.process_files(args.input, args.format, args.jobs)
+        else:
+            processor.process_file(args.input[0], args.out, args.format)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
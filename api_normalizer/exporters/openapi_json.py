@@ -1,17 +1,16 @@
 """Exportador a formato OpenAPI JSON."""
 
-import json
-from typing import Dict, Any
+from typing import Dict, Any, BinaryIO
 
+import orjson
 
-def export_json(spec: Dict[str, Any]) -> str:
+
+def export_json(spec: Dict[str, Any], stream: BinaryIO) -> None:
     """
     Exporta el esquema OpenAPI a formato JSON.
 
     Args:
         spec: Esquema OpenAPI como diccionario
-
-    Returns:
-        Esquema OpenAPI en formato JSON
+        stream: Flujo binario donde se escribe el JSON codificado en UTF-8
     """
-    return json.dumps(spec, indent=2, ensure_ascii=False)
+    stream.write(orjson.dumps(spec, option=orjson.OPT_INDENT_2))
@@ -1,17 +1,36 @@
 """Exportador a formato OpenAPI YAML."""
 
 import yaml
-from typing import Dict, Any
+from typing import Dict, Any, BinaryIO
 
 
-def export_yaml(spec: Dict[str, Any]) -> str:
+class _Dumper(yaml.SafeDumper):
+    """Dumper que no genera anclas/alias para objetos compartidos."""
+
+    def ignore_aliases(self, data: Any) -> bool:
+        # El normalizador reutiliza diccionarios de solo lectura entre
+        # operaciones; cada aparición se emite completa como antes
+        return True
+
+
+def export_yaml(spec: Dict[str, Any], stream: BinaryIO) -> None:
     """
     Exporta el esquema OpenAPI a formato YAML.
 
+    Se usa SafeDumper (emisor en Python puro) y no CSafeDumper: LibYAML escapa
+    los caracteres fuera del BMP (p. ej. emojis) aunque se pase
+    allow_unicode=True, y la salida dependería de cómo se compiló PyYAML.
+
     Args:
         spec: Esquema OpenAPI como diccionario
-
-    Returns:
-        Esquema OpenAPI en formato YAML
+        stream: Flujo binario donde se escribe el YAML codificado en UTF-8
     """
-    return yaml.dump(spec, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    yaml.dump(
+        spec,
+        stream,
+        Dumper=_Dumper,
+        encoding="utf-8",
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=False,
+    )
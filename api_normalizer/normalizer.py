@@ -1,8 +1,97 @@
 """Normalizador para convertir endpoints en esquema OpenAPI 3.0."""
 
-from typing import List, Dict, Any, Set
+import sys
+from functools import lru_cache
+from typing import List, Dict, Any, Set, Tuple
 from .parser import Endpoint
 
+# Nombres de operación OpenAPI (método en minúsculas) internados una sola vez,
+# para no crear una cadena nueva por endpoint
+_OPERATION_METHODS = {
+    method: sys.intern(method.lower())
+    for method in ("GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS")
+}
+
+
+def _operation_method(method: str) -> str:
+    """
+    Obtiene el nombre de la operación OpenAPI para un método HTTP.
+
+    Args:
+        method: Método HTTP en mayúsculas (ej: GET)
+
+    Returns:
+        Método en minúsculas (ej: get)
+    """
+    return _OPERATION_METHODS.get(method) or method.lower()
+
+
+# Esquema compartido por todos los parámetros de ruta (solo lectura)
+_STRING_SCHEMA = {"type": "string"}
+
+
+@lru_cache(maxsize=4096)
+def _path_parameter(param_name: str) -> Dict[str, Any]:
+    """
+    Crea (una sola vez por nombre) un parámetro de ruta OpenAPI.
+
+    El diccionario devuelto se comparte entre operaciones y no debe
+    modificarse.
+
+    Args:
+        param_name: Nombre del parámetro
+
+    Returns:
+        Parámetro OpenAPI
+    """
+    return {
+        "name": param_name,
+        "in": "path",
+        "required": True,
+        "schema": _STRING_SCHEMA,
+        "description": f"Identificador del {param_name}",
+    }
+
+
+@lru_cache(maxsize=None)
+def _tag_from_path(path: str) -> str:
+    """
+    Extrae el tag del primer segmento de la ruta (memoizado por ruta).
+
+    Args:
+        path: Ruta del endpoint (ej: /users/{id})
+
+    Returns:
+        Tag extraído (ej: users)
+    """
+    path_segments = path.split("/")
+    if len(path_segments) < 2:
+        return "default"
+
+    first_segment = path_segments[1]
+    # Remover parámetros de la ruta
+    tag = first_segment.split("{")[0]
+
+    return tag or "default"
+
+
+@lru_cache(maxsize=None)
+def _split_segments(path: str) -> Tuple[str, ...]:
+    """
+    Divide la ruta en segmentos excluyendo parámetros (memoizado por ruta).
+
+    Args:
+        path: Ruta del endpoint (ej: /users/{id}/orders)
+
+    Returns:
+        Tupla de segmentos (ej: ("users", "orders"))
+    """
+    return tuple(
+        segment
+        for segment in path.split("/")
+        if segment and not segment.startswith("{")
+    )
+
 
 class Normalizer:
     """Normaliza endpoints a esquema OpenAPI 3.0."""
@@ -19,6 +108,11 @@ class Normalizer:
     SUCCESS_DESCRIPTION = "Respuesta exitosa"
     DEFAULT_CONTENT_TYPE = "application/json"
 
+    def __init__(self):
+        # Las respuestas por defecto son idénticas para todas las operaciones
+        # y no se modifican después, así que se construyen una sola vez
+        self._default_responses = self._create_default_responses()
+
     def normalize(self, endpoints: List[Endpoint], title: str = "API") -> Dict[str, Any]:
         """
         Convierte una lista de endpoints en un esquema OpenAPI 3.0.
@@ -51,14 +145,12 @@ class Normalizer:
         Returns:
             Diccionario de paths con sus operaciones
         """
-        paths = {}
+        paths: Dict[str, Dict[str, Any]] = {}
 
         for endpoint in endpoints:
-            if endpoint.path not in paths:
-                paths[endpoint.path] = {}
-
-            operation = self._create_operation(endpoint)
-            paths[endpoint.path][endpoint.method.lower()] = operation
+            method = _operation_method(endpoint.method)
+            operations = paths.setdefault(endpoint.path, {})
+            operations[method] = self._create_operation(endpoint)
 
         return paths
 
@@ -141,7 +233,7 @@ class Normalizer:
         if endpoint.parameters:
             operation["parameters"] = self._create_path_parameters(endpoint.parameters)
 
-        operation["responses"] = self._create_default_responses()
+        operation["responses"] = self._default_responses
 
         return operation
 
@@ -173,15 +265,7 @@ class Normalizer:
         Returns:
             Tag extraído (ej: users)
         """
-        path_segments = path.split("/")
-        if len(path_segments) < 2:
-            return "default"
-
-        first_segment = path_segments[1]
-        # Remover parámetros de la ruta
-        tag = first_segment.split("{")[0]
-
-        return tag or "default"
+        return _tag_from_path(path)
 
     def _generate_operation_id(self, endpoint: Endpoint) -> str:
         """
@@ -193,7 +277,7 @@ class Normalizer:
         Returns:
             operationId generado
         """
-        method = endpoint.method.lower()
+        method = _operation_method(endpoint.method)
         path_segments = self._extract_path_segments(endpoint.path)
 
         if not path_segments:
@@ -210,7 +294,7 @@ class Normalizer:
 
         return f"{method}_{resource}"
 
-    def _extract_path_segments(self, path: str) -> List[str]:
+    def _extract_path_segments(self, path: str) -> Tuple[str, ...]:
         """
         Extrae los segmentos de la ruta excluyendo parámetros.
 
@@ -218,15 +302,13 @@ class Normalizer:
             path: Ruta del endpoint
 
         Returns:
-            Lista de segmentos de la ruta
+            Tupla de segmentos de la ruta
         """
-        return [
-            segment
-            for segment in path.split("/")
-            if segment and not segment.startswith("{")
-        ]
+        return _split_segments(path)
 
-    def _create_path_parameters(self, param_names: List[str]) -> List[Dict[str, Any]]:
+    def _create_path_parameters(
+        self, param_names: Tuple[str, ...]
+    ) -> List[Dict[str, Any]]:
         """
         Crea la lista de parámetros de ruta OpenAPI.
 
@@ -236,13 +318,4 @@ class Normalizer:
         Returns:
             Lista de parámetros OpenAPI
         """
-        return [
-            {
-                "name": param_name,
-                "in": "path",
-                "required": True,
-                "schema": {"type": "string"},
-                "description": f"Identificador del {param_name}",
-            }
-            for param_name in param_names
-        ]
+        return [_path_parameter(param_name) for param_name in param_names]
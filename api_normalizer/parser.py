@@ -1,39 +1,56 @@
 """Parser para extraer endpoints HTTP de documentación no estructurada."""
 
 import re
-from typing import List, Optional
-
-
+from dataclasses import dataclass
+from typing import List, Tuple
+
+try:
+    # Motor DFA de RE2 (opcional) para el escáner de endpoints
+    import re2 as _endpoint_re  # type: ignore
+except ImportError:
+    _endpoint_re = re
+
+
+# Espacios en blanco Unicode salvo el salto de línea: los mismos caracteres que
+# \s en `re` (y que elimina str.strip()). Se enumeran de forma explícita porque
+# \s en RE2 solo cubre ASCII y ambos motores deben dar el mismo resultado.
+INLINE_WHITESPACE = (
+    "\t\x0b\x0c\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a"
+    "\u2028\u2029\u202f\u205f\u3000"
+)
+
+# Patrones de detección. El patrón se aplica sobre el documento completo
+# (MULTILINE), así que admite espacios al inicio de línea y no permite que el
+# separador entre método y ruta cruce un salto de línea. Los flags van en línea
+# para que la misma expresión sirva en `re` y en `re2`. Se definen a nivel de
+# módulo porque mypyc no puede evaluar f-strings que usan atributos de clase.
+HTTP_METHODS = r"(GET|POST|PUT|DELETE|PATCH|HEAD|OPTIONS)"
+ENDPOINT_PATTERN = _endpoint_re.compile(
+    rf"(?im)^[{INLINE_WHITESPACE}]*{HTTP_METHODS}"
+    rf"[{INLINE_WHITESPACE}]+(/[^\n{INLINE_WHITESPACE}]+)"
+)
+
+
+@dataclass(frozen=True, slots=True, repr=False)
 class Endpoint:
     """Representa un endpoint HTTP detectado."""
 
-    def __init__(
-        self,
-        method: str,
-        path: str,
-        description: Optional[str] = None,
-        parameters: Optional[List[str]] = None,
-    ):
-        self.method = method.upper()
-        self.path = path
-        self.description = description or ""
-        self.parameters = parameters or []
-
-    def __repr__(self):
+    method: str
+    path: str
+    description: str = ""
+    parameters: Tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        # La instancia es inmutable; el método se normaliza una única vez aquí
+        object.__setattr__(self, "method", self.method.upper())
+
+    def __repr__(self) -> str:
         return f"Endpoint({self.method} {self.path})"
 
 
 class Parser:
     """Parsea documentación Markdown/texto para extraer endpoints HTTP."""
 
-    # Patrones de detección
-    HTTP_METHODS = r"(GET|POST|PUT|DELETE|PATCH|HEAD|OPTIONS)"
-    ENDPOINT_PATTERN = re.compile(
-        rf"^{HTTP_METHODS}\s+(/[^\s]+)",
-        re.IGNORECASE | re.MULTILINE,
-    )
-    PARAM_PATTERN = re.compile(r"\{(\w+)\}")
-
     # Configuración de extracción de descripción
     MAX_DESCRIPTION_LINES = 3
 
@@ -41,44 +58,38 @@ class Parser:
         """
         Parsea el contenido y extrae endpoints HTTP.
 
+        Recorre el documento con una única pasada de ``finditer`` en lugar de
+        dividirlo en líneas; solo se extraen líneas alrededor de cada endpoint.
+
         Args:
             content: Contenido del archivo de documentación
 
         Returns:
             Lista de endpoints detectados
         """
-        lines = content.split("\n")
-        endpoints = []
-
-        for line_index, line in enumerate(lines):
-            endpoint = self._parse_line_for_endpoint(line, lines, line_index)
-            if endpoint:
-                endpoints.append(endpoint)
-
-        return endpoints
+        return [
+            self._create_endpoint(match, content)
+            for match in ENDPOINT_PATTERN.finditer(content)
+        ]
 
-    def _parse_line_for_endpoint(
-        self, line: str, all_lines: List[str], line_index: int
-    ) -> Optional[Endpoint]:
+    def _create_endpoint(self, match: "re.Match[str]", content: str) -> Endpoint:
         """
-        Intenta parsear una línea para detectar un endpoint.
+        Crea un endpoint a partir de una coincidencia del patrón.
 
         Args:
-            line: Línea actual a analizar
-            all_lines: Todas las líneas del documento
-            line_index: Índice de la línea actual
+            match: Coincidencia de ENDPOINT_PATTERN
+            content: Contenido completo del documento
 
         Returns:
-            Endpoint detectado o None
+            Endpoint detectado
         """
-        match = self.ENDPOINT_PATTERN.match(line.strip())
-        if not match:
-            return None
-
         method = match.group(1)
         path = match.group(2)
         parameters = self._extract_path_parameters(path)
-        description = self._extract_description(all_lines, line_index)
+        following_lines = self._read_following_lines(
+            content, match.end(), self.MAX_DESCRIPTION_LINES
+        )
+        description = self._extract_description(following_lines)
 
         return Endpoint(
             method=method,
@@ -87,7 +98,34 @@ class Parser:
             parameters=parameters,
         )
 
-    def _extract_path_parameters(self, path: str) -> List[str]:
+    def _read_following_lines(
+        self, content: str, position: int, max_lines: int
+    ) -> List[str]:
+        """
+        Obtiene las líneas que siguen a la línea que contiene una posición.
+
+        Args:
+            content: Contenido completo del documento
+            position: Posición dentro de la línea actual
+            max_lines: Número máximo de líneas a devolver
+
+        Returns:
+            Hasta max_lines líneas posteriores, sin el salto de línea
+        """
+        following_lines: List[str] = []
+        line_end = content.find("\n", position)
+
+        while line_end != -1 and len(following_lines) < max_lines:
+            line_start = line_end + 1
+            line_end = content.find("\n", line_start)
+            if line_end == -1:
+                following_lines.append(content[line_start:])
+            else:
+                following_lines.append(content[line_start:line_end])
+
+        return following_lines
+
+    def _extract_path_parameters(self, path: str) -> Tuple[str, ...]:
         """
         Extrae los nombres de parámetros de una ruta.
 
@@ -95,30 +133,55 @@ class Parser:
             path: Ruta del endpoint (ej: /users/{id})
 
         Returns:
-            Lista de nombres de parámetros
+            Tupla de nombres de parámetros
         """
-        return self.PARAM_PATTERN.findall(path)
+        # Búsqueda manual de "{nombre}" con str.find; equivale a la expresión
+        # regular \{(\w+)\} sin el coste de invocar el motor por cada ruta
+        parameters: List[str] = []
+        start = path.find("{")
+
+        while start != -1:
+            end = path.find("}", start + 1)
+            if end == -1:
+                break
+
+            name = path[start + 1:end]
+            if self._is_word(name):
+                parameters.append(name)
+                start = path.find("{", end + 1)
+            else:
+                # Puede haber un "{" posterior dentro del mismo tramo ({{id}})
+                start = path.find("{", start + 1)
 
-    def _extract_description(self, lines: List[str], start_index: int) -> str:
+        return tuple(parameters)
+
+    def _is_word(self, text: str) -> bool:
+        """
+        Indica si el texto está formado solo por caracteres de palabra.
+
+        Args:
+            text: Texto a comprobar
+
+        Returns:
+            True si no está vacío y solo contiene alfanuméricos o "_"
+        """
+        letters = text.replace("_", "")
+        return bool(text) and (not letters or letters.isalnum())
+
+    def _extract_description(self, following_lines: List[str]) -> str:
         """
         Extrae la descripción del endpoint desde las líneas siguientes.
 
         Args:
-            lines: Todas las líneas del documento
-            start_index: Índice de la línea donde está el endpoint
+            following_lines: Líneas posteriores a la del endpoint
 
         Returns:
             Descripción extraída o cadena vacía
         """
-        description_parts = []
-        current_index = start_index + 1
-        end_index = min(
-            current_index + self.MAX_DESCRIPTION_LINES,
-            len(lines)
-        )
+        description_parts: List[str] = []
 
-        for line_index in range(current_index, end_index):
-            line = lines[line_index].strip()
+        for raw_line in following_lines:
+            line = raw_line.strip()
 
             if self._should_stop_description_extraction(line, description_parts):
                 break
@@ -142,7 +205,7 @@ class Parser:
             True si se debe detener, False en caso contrario
         """
         # Detener si encontramos otro endpoint
-        if self.ENDPOINT_PATTERN.match(line):
+        if ENDPOINT_PATTERN.match(line):
             return True
 
         # Detener si encontramos un encabezado Markdown
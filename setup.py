@@ -0,0 +1,23 @@
+"""Compilación opcional del parser con mypyc.
+
+La configuración del paquete vive en pyproject.toml. Este archivo solo añade
+las extensiones compiladas cuando se define API_NORMALIZER_USE_MYPYC=1 y mypy
+está instalado; en cualquier otro caso se instala el módulo en Python puro.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+
+if os.environ.get("API_NORMALIZER_USE_MYPYC") == "1":
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        # Sin mypy se instala el parser en Python puro
+        pass
+    else:
+        ext_modules = mypycify(["api_normalizer/parser.py"])
+
+setup(ext_modules=ext_modules)
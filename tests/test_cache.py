@@ -0,0 +1,41 @@
+"""Tests del cache local."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from api_normalizer.cache import Cache
+
+
+class CorruptDatabaseTest(unittest.TestCase):
+    """Una base de datos ilegible no impide usar el cache."""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_path = Path(temp_dir.name)
+
+        home_patch = mock.patch.dict(os.environ, {"HOME": str(self.temp_path)})
+        home_patch.start()
+        self.addCleanup(home_patch.stop)
+
+    def test_falls_back_to_memory(self):
+        cache_dir = self.temp_path / Cache.CACHE_DIR_NAME / Cache.CACHE_SUBDIR
+        cache_dir.mkdir(parents=True)
+        db_file = cache_dir / Cache.DB_FILE_NAME
+        db_file.write_bytes(b"esto no es una base de datos SQLite" * 100)
+
+        cache = Cache()
+        self.addCleanup(cache.connection.close)
+        content_hash = cache.get_hash(b"GET /users\n")
+        cache.set(content_hash, {"openapi": "3.0.0"})
+
+        self.assertEqual(cache.get(content_hash), {"openapi": "3.0.0"})
+        # El archivo original no se modifica
+        self.assertTrue(db_file.read_bytes().startswith(b"esto no es"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+"""Tests de la interfaz de línea de comandos."""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from api_normalizer.cache import Cache
+from api_normalizer.cli import Processor
+
+
+class LineEndingTest(unittest.TestCase):
+    """Los finales de línea CR y CRLF se tratan igual que LF."""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_path = Path(temp_dir.name)
+
+        # Cache aislado en un HOME temporal
+        home_patch = mock.patch.dict(os.environ, {"HOME": str(self.temp_path)})
+        home_patch.start()
+        self.addCleanup(home_patch.stop)
+
+    def _process(self, name: str, content: bytes) -> dict:
+        input_file = self.temp_path / name
+        input_file.write_bytes(content)
+        output_file = input_file.with_suffix(".json")
+        Processor().process_file(str(input_file), str(output_file), "json")
+        return json.loads(output_file.read_text(encoding="utf-8"))
+
+    def _assert_both_endpoints(self, spec: dict) -> None:
+        paths = spec["paths"]
+        self.assertEqual(list(paths), ["/users", "/orders/{id}"])
+        self.assertEqual(paths["/users"]["get"]["description"], "Lista")
+        self.assertEqual(paths["/orders/{id}"]["post"]["description"], "Crear")
+
+    def test_cr_line_endings(self):
+        spec = self._process(
+            "cr.md", b"GET /users\rLista\rPOST /orders/{id}\rCrear\r"
+        )
+        self._assert_both_endpoints(spec)
+
+    def test_crlf_line_endings(self):
+        spec = self._process(
+            "crlf.md", b"GET /users\r\nLista\r\nPOST /orders/{id}\r\nCrear\r\n"
+        )
+        self._assert_both_endpoints(spec)
+
+
+class StatFingerprintTest(unittest.TestCase):
+    """La huella (ruta, tamaño, mtime) evita releer archivos sin cambios."""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_path = Path(temp_dir.name)
+
+        home_patch = mock.patch.dict(os.environ, {"HOME": str(self.temp_path)})
+        home_patch.start()
+        self.addCleanup(home_patch.stop)
+
+        self.input_file = self.temp_path / "api.md"
+        self.input_file.write_bytes(b"GET /users\nLista\n")
+        Processor()._get_or_process_spec(self.input_file)
+
+    def _process_again(self) -> mock.MagicMock:
+        processor = Processor()
+        with mock.patch.object(
+            processor, "_read_input_bytes", wraps=processor._read_input_bytes
+        ) as read_input:
+            spec = processor._get_or_process_spec(self.input_file)
+        self.assertIn("/users", spec["paths"])
+        return read_input
+
+    def test_unchanged_file_is_not_read(self):
+        self._process_again().assert_not_called()
+
+    def test_size_change_forces_rehash(self):
+        self.input_file.write_bytes(b"GET /users\nLista de usuarios\n")
+        self._process_again().assert_called_once()
+
+    def test_mtime_change_forces_rehash(self):
+        file_stat = self.input_file.stat()
+        os.utime(
+            self.input_file,
+            ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1_000_000_000),
+        )
+        self._process_again().assert_called_once()
+
+
+class DelayedCacheWriteTest(unittest.TestCase):
+    """Las entradas con delay=True se ven antes del flush y se escriben en él."""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_path = Path(temp_dir.name)
+
+        home_patch = mock.patch.dict(os.environ, {"HOME": str(self.temp_path)})
+        home_patch.start()
+        self.addCleanup(home_patch.stop)
+
+    def _stored(self, stat_key: tuple, content_hash: bytes) -> tuple:
+        # Una conexión independiente solo ve lo que ya está escrito en disco
+        cache = Cache()
+        self.addCleanup(cache.connection.close)
+        return cache.lookup_stat(*stat_key), cache.exists(content_hash)
+
+    def test_flush_writes_pending_entries(self):
+        input_file = self.temp_path / "api.md"
+        input_file.write_bytes(b"GET /users\nLista\n")
+        file_stat = input_file.stat()
+        stat_key = (str(input_file.resolve()), file_stat.st_size, file_stat.st_mtime_ns)
+
+        processor = Processor()
+        spec = processor._get_or_process_spec(input_file, delay_cache=True)
+
+        content_hash = processor.cache.lookup_stat(*stat_key)
+        self.assertIsNotNone(content_hash)
+        self.assertEqual(processor.cache.get(content_hash), spec)
+        self.assertEqual(self._stored(stat_key, content_hash), (None, False))
+
+        processor.cache.flush()
+
+        self.assertEqual(self._stored(stat_key, content_hash), (content_hash, True))
+
+
+class ParallelProcessingTest(unittest.TestCase):
+    """Con jobs > 1 el proceso principal no abre el cache."""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_path = Path(temp_dir.name)
+
+        home_patch = mock.patch.dict(os.environ, {"HOME": str(self.temp_path)})
+        home_patch.start()
+        self.addCleanup(home_patch.stop)
+
+    def test_parent_does_not_open_cache(self):
+        input_paths = []
+        for name in ("a.md", "b.md"):
+            input_file = self.temp_path / name
+            input_file.write_text(f"GET /{input_file.stem}\n", encoding="utf-8")
+            input_paths.append(str(input_file))
+
+        processor = Processor()
+        processor.process_files(input_paths, "json", jobs=2)
+
+        self.assertIsNone(processor._cache)
+        for input_path in input_paths:
+            self.assertTrue(Path(input_path).with_suffix(".json").exists())
+
+
+class CompressedOutputPathTest(unittest.TestCase):
+    """Con --compress zstd la salida lleva siempre la extensión .zst."""
+
+    def _output_file(self, output_path, compression="zstd"):
+        processor = Processor(compression=compression)
+        return processor._determine_output_file(Path("api.md"), output_path, "json")
+
+    def test_default_output_gets_zst(self):
+        self.assertEqual(self._output_file(None), Path("api.json.zst"))
+
+    def test_explicit_output_gets_zst(self):
+        self.assertEqual(self._output_file("spec.json"), Path("spec.json.zst"))
+
+    def test_explicit_zst_output_is_kept(self):
+        self.assertEqual(self._output_file("spec.json.zst"), Path("spec.json.zst"))
+
+    def test_uncompressed_output_is_kept(self):
+        self.assertEqual(self._output_file("spec.json", None), Path("spec.json"))
+
+
+if __name__ == "__main__":
+    unittest.main()
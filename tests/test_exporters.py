@@ -0,0 +1,20 @@
+"""Tests de los exportadores."""
+
+import io
+import unittest
+
+from api_normalizer.exporters.openapi_yaml import export_yaml
+
+
+class YamlExportTest(unittest.TestCase):
+    """El YAML exportado conserva los caracteres Unicode tal cual."""
+
+    def test_emoji_is_not_escaped(self):
+        stream = io.BytesIO()
+        export_yaml({"summary": "Lista usuarios 🚀"}, stream)
+        output = stream.getvalue().decode("utf-8")
+        self.assertEqual(output, "summary: Lista usuarios 🚀\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+"""Tests del parser de endpoints."""
+
+import unittest
+
+from api_normalizer.parser import Parser
+
+
+class UnicodeWhitespaceTest(unittest.TestCase):
+    """El escáner trata los espacios Unicode igual que str.strip() y \\s."""
+
+    def _parse(self, content: str):
+        return [(e.method, e.path) for e in Parser().parse(content)]
+
+    def test_non_breaking_space_between_method_and_path(self):
+        self.assertEqual(self._parse("GET\xa0/users"), [("GET", "/users")])
+
+    def test_vertical_tab_between_method_and_path(self):
+        self.assertEqual(self._parse("GET\x0b/users"), [("GET", "/users")])
+
+    def test_leading_em_space(self):
+        self.assertEqual(self._parse("\u2003GET /a"), [("GET", "/a")])
+
+    def test_em_space_ends_path(self):
+        self.assertEqual(self._parse("GET /a\u2003b"), [("GET", "/a")])
+
+
+if __name__ == "__main__":
+    unittest.main()